@@ -7,25 +7,37 @@ Features
 * Add/Delete frame, Play/Stop animation (QTimer)
 * Dynamic grid resize at any time – arrays are padded/cropped as requested
 * Export / Import full animation as 3‑D ``.npy`` or current frame as 2‑D ``.npy``
+* Compact 1‑bit‑per‑cell animation format (``.npz`` with ``np.packbits``)
 
 Dependencies
 ------------
 ::
 
    pip install PyQt5 numpy
+   pip install numba  # optional, speeds up resizing long animations
 
 Run with ``python pixel_art_editor.py``.
 """
 
 from __future__ import annotations
 
+import itertools
 import sys
 import typing as _t
 from pathlib import Path
 
 import numpy as np
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QColor, QImage, QPixmap, QIcon
+from PyQt5.QtCore import (
+    QObject,
+    QRect,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QColor, QIcon, QIconEngine, QImage, QPainter, QPixmap
 from PyQt5.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -37,17 +49,206 @@ from PyQt5.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
+    QScrollArea,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
     QToolBar,
     QVBoxLayout,
     QWidget,
 )
 
+try:  # numba 为可选依赖，缺失时退回纯 NumPy 实现
+    import numba
+except ImportError:
+    numba = None
+
 CELL_SIZE = 30  # pixels per cell in main grid
 THUMB_SCALE = 40  # pixels per cell in thumbnail preview (进一步增大预览图)
 
+NPY_FILTER = "NumPy Files (*.npy)"
+PACKED_FILTER = "Packed Frames (*.npz)"  # 每格 1 bit，体积约为 .npy 的 1/8
+
+# 帧数达到该值才使用 numba 内核缩放；帧数少时 NumPy 切片拷贝已足够快，
+# 不值得付出首次 JIT 编译的开销
+NUMBA_MIN_FRAMES = 1000
+
+
+# 颜色常量只构造一次，避免在热路径中反复解析颜色字符串
+_BLACK = QColor(0, 0, 0)
+_WHITE = QColor(255, 255, 255)
+_GRID = QColor(211, 211, 211)  # lightgray
+_BLACK_RGB = _BLACK.rgb()
+_WHITE_RGB = _WHITE.rgb()
+
+# 调色板：像素值 0 -> 白色，1 -> 黑色
+COLOR_TABLE = [_WHITE_RGB, _BLACK_RGB]
+
+
+def pack_frames(frames: np.ndarray) -> np.ndarray:
+    """(N, rows, cols) 的 0/1 数组按行打包成 (N, rows, ceil(cols/8)) 字节"""
+    return np.packbits(frames, axis=-1)
+
+
+def unpack_frames(bits: np.ndarray, cols: int) -> np.ndarray:
+    """pack_frames 的逆操作"""
+    return np.unpackbits(bits, axis=-1, count=cols)
+
+
+def frame_to_image(arr: np.ndarray) -> QImage:
+    """把 0/1 帧数组转换为原始尺寸（每格 1 像素）的 QImage
+
+    直接把 uint8 数组当作 Indexed8 图像的像素数据，零拷贝，
+    颜色由调色板查表得到。
+    """
+    h, w = arr.shape
+    buf = np.ascontiguousarray(arr, dtype=np.uint8)
+    img = QImage(buf.data, w, h, w, QImage.Format_Indexed8)
+    img.setColorTable(COLOR_TABLE)
+    img._buf = buf  # 保持缓冲区存活
+    return img
+
+
+if numba is not None:
+
+    def _resize_stack(src, dst, min_r, min_c):
+        """把 src 每一帧左上角 min_r×min_c 的区域拷贝到 dst（按帧并行）"""
+        for i in numba.prange(src.shape[0]):
+            dst[i, :min_r, :min_c] = src[i, :min_r, :min_c]
+
+    try:
+        _resize_stack = numba.njit(parallel=True, cache=True)(_resize_stack)
+    except RuntimeError:
+        # 没有可写的缓存目录（例如 PyInstaller 打包后），不缓存编译结果
+        _resize_stack = numba.njit(parallel=True)(_resize_stack)
+
+else:
+    _resize_stack = None
+
+
+class ThumbSignals(QObject):
+    # (thumb id, image)
+    rendered = pyqtSignal(int, QImage)
+
+
+class ThumbRenderer(QRunnable):
+    """在线程池中生成缩略图 QImage（QPixmap 只能在 GUI 线程创建）"""
+
+    def __init__(self, signals: ThumbSignals, thumb_id: int, frame: np.ndarray):
+        super().__init__()
+        self.signals = signals
+        self.thumb_id = thumb_id
+        self.frame = frame  # GUI 线程拷贝出的快照，工作线程独占
+
+    def run(self):
+        # copy() 使 QImage 拥有自己的数据，脱离 NumPy 缓冲区
+        img = frame_to_image(self.frame).copy()
+        self.signals.rendered.emit(self.thumb_id, img)
+
+
+class PixelIconEngine(QIconEngine):
+    """以原始尺寸保存像素图，绘制时才用最近邻放大到图标大小
+
+    QIcon 默认不会把像素图放大超过其原始尺寸，因此需要自定义引擎。
+    """
+
+    def __init__(self, pixmap: QPixmap):
+        super().__init__()
+        self._pixmap = pixmap
+
+    def actualSize(self, size: QSize, mode, state) -> QSize:
+        return self._pixmap.size().scaled(size, Qt.KeepAspectRatio)
+
+    def paint(self, painter: QPainter, rect: QRect, mode, state):
+        target = QRect(rect.topLeft(), self.actualSize(rect.size(), mode, state))
+        target.moveCenter(rect.center())
+        painter.save()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        painter.drawPixmap(target, self._pixmap)
+        painter.restore()
+
+    def pixmap(self, size: QSize, mode, state) -> QPixmap:
+        return self._pixmap.scaled(size, Qt.KeepAspectRatio, Qt.FastTransformation)
+
+    def clone(self) -> QIconEngine:
+        return PixelIconEngine(self._pixmap)
+
+
+class PixelGrid(QWidget):
+    """自绘的像素网格：整帧一次 drawImage，替代逐格的 QTableWidgetItem"""
+
+    def __init__(self, editor: "PixelArtEditor", parent: QWidget | None = None):
+        super().__init__(parent)
+        self.editor = editor
+        self.frame: np.ndarray | None = None
+
+        # 鼠标拖动状态（未开启鼠标追踪，只有按住按键时才会收到 mouseMoveEvent）
+        # 按下时绑定正在绘制的帧；为 None 表示没有进行中的笔画
+        self._paint_frame: np.ndarray | None = None
+        self._paint_index = 0
+        self._paint_indices: set[tuple[int, int]] = set()  # 本次笔画已反色的单元格
+
+    def set_frame(self, frame: np.ndarray):
+        self.frame = frame
+        h, w = frame.shape
+        self.setFixedSize(w * CELL_SIZE, h * CELL_SIZE)
+
+    def cell_rect(self, row: int, col: int) -> QRect:
+        return QRect(col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+
+    def cell_at(self, event) -> tuple[int, int] | None:
+        pos = event.pos()
+        row, col = pos.y() // CELL_SIZE, pos.x() // CELL_SIZE
+        h, w = self.frame.shape
+        if 0 <= row < h and 0 <= col < w:
+            return row, col
+        return None
+
+    # ---------- Painting ----------
+    def paintEvent(self, event):
+        if self.frame is None:
+            return
+        h, w = self.frame.shape
+        painter = QPainter(self)
+        # 默认不开启 SmoothPixmapTransform，即按最近邻放大
+        painter.drawImage(self.rect(), frame_to_image(self.frame))
+        painter.setPen(_GRID)
+        for r in range(1, h):
+            painter.drawLine(0, r * CELL_SIZE, w * CELL_SIZE, r * CELL_SIZE)
+        for c in range(1, w):
+            painter.drawLine(c * CELL_SIZE, 0, c * CELL_SIZE, h * CELL_SIZE)
+        painter.end()
+
+    # ---------- Mouse ----------
+    def mousePressEvent(self, event):
+        """鼠标按下时反色按下的单元格"""
+        pos = self.cell_at(event)
+        if self.editor.playing or pos is None:
+            return
+        # 播放时无法开始笔画，因此拖动过程中不必再检查播放状态
+        self._paint_frame = self.editor.current_frame()
+        self._paint_index = self.editor.current_index
+        self._paint_indices = set()
+        self.paint_cell(pos)
+
+    def mouseMoveEvent(self, event):
+        """拖动时反色每个经过的像素（每次笔画每格最多反色一次）"""
+        if self._paint_frame is None:
+            return
+        pos = self.cell_at(event)
+        if pos is not None and pos not in self._paint_indices:
+            self.paint_cell(pos)
+
+    def paint_cell(self, pos: tuple[int, int]):
+        self._paint_indices.add(pos)
+        self._paint_frame[pos] ^= 1  # 反色操作：0变1，1变0
+        self.editor.update_cell_display(*pos)
+        self.editor.mark_thumb_dirty(self._paint_index)
+
+    def mouseReleaseEvent(self, event):
+        self._paint_frame = None
+        self._paint_indices = set()
+        # 松开鼠标时立即刷新缩略图，不必等待定时器
+        self.editor.flush_dirty_thumbs()
+
 
 class PixelArtEditor(QMainWindow):
     def __init__(self):
@@ -61,20 +262,33 @@ class PixelArtEditor(QMainWindow):
         # ------- Data model -------
         self.rows = 8
         self.cols = 8
-        self.frames: list[np.ndarray] = [
-            np.zeros((self.rows, self.cols), dtype=np.uint8)
-        ]
+        # 所有帧连续存放在一个 (capacity, rows, cols) 数组中，前 n_frames 帧有效；
+        # 像 vector 一样按倍数扩容，插入帧均摊 O(1) 次分配
+        self._frames_buf = np.zeros((1, self.rows, self.cols), dtype=np.uint8)
+        self.n_frames = 1
+        # 缩略图缓存：与 frames_arr 一一对应，None 表示需要重新生成
+        self._thumb_cache: list[QIcon | None] = [None]
+        # 每帧内容的唯一编号，与 _thumb_cache 同步插入/删除；帧内容改变时换新编号，
+        # 后台生成的缩略图按编号而不是下标找回所属的帧
+        self._thumb_id_counter = itertools.count()
+        self._thumb_ids: list[int] = [next(self._thumb_id_counter)]
         self.current_index = 0
         self.playing = False
         self.timer = QTimer(self)
         self.timer.setInterval(200)
         self.timer.timeout.connect(self.next_frame)
 
-        # 添加鼠标拖动状态
-        self.is_dragging = False
-        self.mouse_pressed = False
-        self.start_pos = None
-        self.drag_value = 0  # 拖拽时设置的目标值
+        # 拖动绘制时合并缩略图刷新，最多约 30 Hz
+        self._thumb_dirty: set[int] = set()
+        self._thumb_dirty_timer = QTimer(self)
+        self._thumb_dirty_timer.setSingleShot(True)
+        self._thumb_dirty_timer.setInterval(33)
+        self._thumb_dirty_timer.timeout.connect(self.flush_dirty_thumbs)
+
+        # 载入/缩放后在后台线程批量生成缩略图，GUI 线程保持响应
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_signals = ThumbSignals(self)
+        self._thumb_signals.rendered.connect(self.on_thumb_rendered)
 
         # ------- UI -------
         central = QWidget(self)
@@ -85,30 +299,17 @@ class PixelArtEditor(QMainWindow):
         self.thumb_list = QListWidget()
         self.thumb_list.setViewMode(QListWidget.IconMode)
         self.thumb_list.setFlow(QListWidget.LeftToRight)
-        self.thumb_list.setIconSize(QPixmap(THUMB_SCALE, THUMB_SCALE).size())
+        self.thumb_list.setIconSize(QSize(THUMB_SCALE, THUMB_SCALE))
         self.thumb_list.setFixedHeight(self.rows * THUMB_SCALE + 40)
         self.thumb_list.itemClicked.connect(self.on_thumb_clicked)
 
         main_v.addWidget(self.thumb_list)
 
-        # Grid table
-        self.table = QTableWidget(self.rows, self.cols)
-        self.table.horizontalHeader().setVisible(False)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.NoSelection)
-
-        # 鼠标事件处理 - 简化的事件连接
-        self.table.cellPressed.connect(self.on_cell_pressed)
-        self.table.cellEntered.connect(self.on_cell_entered)
-
-        # 确保表格能接收鼠标事件
-        self.table.setMouseTracking(False)  # 初始状态关闭鼠标追踪
-
-        # 重写表格的鼠标释放事件
-        self.table.mouseReleaseEvent = self.table_mouse_release_event
-
-        main_v.addWidget(self.table)
+        # Pixel grid（放在滚动区域内，大网格时可滚动）
+        self.grid = PixelGrid(self)
+        grid_scroll = QScrollArea()
+        grid_scroll.setWidget(self.grid)
+        main_v.addWidget(grid_scroll)
 
         # Toolbar buttons - 重新设计布局
         # 上方工具栏：文件操作和画布控制
@@ -154,123 +355,151 @@ class PixelArtEditor(QMainWindow):
         self.status_lbl = QLabel()
         toolbar_bottom.addWidget(self.status_lbl)
 
-        self.update_table_geometry()
+        self.update_grid_geometry()
         self.refresh_thumbs()
         self.update_status()
 
     # ---------- Helpers ----------
-    def current_frame(self) -> np.ndarray:
-        return self.frames[self.current_index]
-
-    def toggle_cell(self, row: int, col: int):
-        """反色单元格状态"""
-        if self.playing:
-            return
-        frame = self.current_frame()
-        frame[row, col] ^= 1  # 反色操作：0变1，1变0
-        self.update_cell_display(row, col)
-        self.refresh_thumb(self.current_index)
-
-    def set_cell(self, row: int, col: int, value: int):
-        """设置单元格为指定值"""
-        if self.playing:
-            return
-        frame = self.current_frame()
-        if frame[row, col] != value:  # 只有在值不同时才更新
-            frame[row, col] = value
-            self.update_cell_display(row, col)
-            self.refresh_thumb(self.current_index)
-
-    def on_cell_pressed(self, row: int, col: int):
-        """鼠标按下时的处理"""
-        if self.playing:
-            return
-
-        self.mouse_pressed = True
-        self.start_pos = (row, col)
-        self.is_dragging = False
+    @property
+    def frames_arr(self) -> np.ndarray:
+        """全部有效帧，形状 (N, rows, cols)，是内部缓冲区的视图"""
+        return self._frames_buf[: self.n_frames]
 
-        # 反色按下的单元格
-        self.toggle_cell(row, col)
-
-        # 启用鼠标追踪以便检测拖动
-        self.table.setMouseTracking(True)
-
-    def on_cell_entered(self, row: int, col: int):
-        """鼠标进入单元格时的处理 - 拖动时反色每个经过的像素"""
-        if self.playing or not self.mouse_pressed:
-            return
-
-        current_pos = (row, col)
-
-        # 如果从起始位置移动了，就开始拖拽模式
-        if self.start_pos and current_pos != self.start_pos:
-            self.is_dragging = True
-
-        # 在拖拽模式下，反色当前单元格
-        if self.is_dragging:
-            self.toggle_cell(row, col)
+    def current_frame(self) -> np.ndarray:
+        return self._frames_buf[self.current_index]
+
+    def set_frames(self, arr: np.ndarray):
+        """整体替换帧数组 (N, rows, cols)，并刷新网格与缩略图"""
+        self._frames_buf = arr
+        self.n_frames = arr.shape[0]
+        self.rows, self.cols = arr.shape[1:]
+        self._thumb_cache = [None] * self.n_frames
+        self._thumb_ids = [next(self._thumb_id_counter) for _ in range(self.n_frames)]
+        self.update_grid_geometry()
+        self.refresh_thumbs()
+        self.update_status()
 
-    def table_mouse_release_event(self, event):
-        """表格的鼠标释放事件处理"""
-        if hasattr(self, "mouse_pressed") and self.mouse_pressed:
-            self.mouse_pressed = False
-            self.is_dragging = False
-            self.start_pos = None
-            # 关闭鼠标追踪以提高性能
-            self.table.setMouseTracking(False)
-        # 调用原始的鼠标释放事件
-        QTableWidget.mouseReleaseEvent(self.table, event)
+    def insert_frame(self, idx: int, frame: np.ndarray):
+        """在 idx 处插入一帧，容量不足时按两倍扩容"""
+        n = self.n_frames
+        if n == self._frames_buf.shape[0]:
+            buf = np.zeros((2 * n, self.rows, self.cols), dtype=np.uint8)
+            buf[:n] = self._frames_buf[:n]
+            self._frames_buf = buf
+        self._frames_buf[idx + 1 : n + 1] = self._frames_buf[idx:n]
+        self._frames_buf[idx] = frame
+        self.n_frames = n + 1
+
+    def remove_frame(self, idx: int):
+        n = self.n_frames
+        self._frames_buf[idx : n - 1] = self._frames_buf[idx + 1 : n]
+        self.n_frames = n - 1
+
+    def mark_thumb_dirty(self, idx: int):
+        """标记缩略图失效，由定时器统一刷新"""
+        self._thumb_cache[idx] = None
+        self._thumb_ids[idx] = next(self._thumb_id_counter)  # 丢弃旧内容的后台结果
+        self._thumb_dirty.add(idx)
+        if not self._thumb_dirty_timer.isActive():
+            self._thumb_dirty_timer.start()
+
+    def flush_dirty_thumbs(self):
+        self._thumb_dirty_timer.stop()
+        for idx in self._thumb_dirty:
+            if idx < self.n_frames:
+                self.refresh_thumb(idx)
+        self._thumb_dirty.clear()
 
     def update_cell_display(self, row: int, col: int):
-        item = self.table.item(row, col)
-        if item is None:
-            item = QTableWidgetItem()
-            self.table.setItem(row, col, item)
-        color = QColor("black") if self.current_frame()[row, col] else QColor("white")
-        item.setBackground(color)
-
-    def update_table_geometry(self):
-        self.table.setRowCount(self.rows)
-        self.table.setColumnCount(self.cols)
-        for r in range(self.rows):
-            self.table.setRowHeight(r, CELL_SIZE)
-        for c in range(self.cols):
-            self.table.setColumnWidth(c, CELL_SIZE)
+        # 只让该单元格所在的矩形区域失效
+        self.grid.update(self.grid.cell_rect(row, col))
+        self._displayed[row, col] = self.current_frame()[row, col]
+
+    def update_grid_geometry(self):
+        # 255 不是合法像素值，保证下一次重绘会刷新所有单元格
+        self._displayed = np.full((self.rows, self.cols), 255, dtype=np.uint8)
         # adjust thumbnail list height
         self.thumb_list.setFixedHeight(self.rows * THUMB_SCALE + 40)
         self.redraw_current_frame()
 
     def redraw_current_frame(self):
-        self.table.clear()
-        for r in range(self.rows):
-            for c in range(self.cols):
-                self.update_cell_display(r, c)
+        """只重绘与当前显示内容不同的区域"""
+        cur = self.current_frame()
+        self.grid.set_frame(cur)
+        diff_r, diff_c = np.nonzero(self._displayed != cur)
+        if diff_r.size:
+            top_left = self.grid.cell_rect(int(diff_r.min()), int(diff_c.min()))
+            bottom_right = self.grid.cell_rect(int(diff_r.max()), int(diff_c.max()))
+            self.grid.update(top_left.united(bottom_right))
+        self._displayed = cur.copy()
 
     # ---------- Frame thumbnails ----------
     def frame_to_pixmap(self, arr: np.ndarray) -> QPixmap:
-        h, w = arr.shape
-        img = QImage(w, h, QImage.Format_RGB32)
-        white = QColor("white").rgb()
-        black = QColor("black").rgb()
-        for y in range(h):
-            for x in range(w):
-                img.setPixel(x, y, black if arr[y, x] else white)
-        return QPixmap.fromImage(img.scaled(w * THUMB_SCALE, h * THUMB_SCALE))
+        # 保持原始分辨率（每格 1 像素），由 PixelIconEngine 在绘制时放大
+        return QPixmap.fromImage(frame_to_image(arr))
+
+    def thumb_icon(self, idx: int) -> QIcon:
+        """返回第 idx 帧的缩略图，仅在缓存失效时重新生成"""
+        icon = self._thumb_cache[idx]
+        if icon is None:
+            icon = QIcon(PixelIconEngine(self.frame_to_pixmap(self._frames_buf[idx])))
+            self._thumb_cache[idx] = icon
+        return icon
 
     def refresh_thumbs(self):
+        """重建缩略图列表：已缓存的直接使用，其余先显示占位项再在后台生成"""
         self.thumb_list.clear()
-        for idx, fr in enumerate(self.frames):
+        for idx in range(self.n_frames):
             item = QListWidgetItem()
-            item.setIcon(QIcon(self.frame_to_pixmap(fr)))
+            icon = self._thumb_cache[idx]
+            if icon is None:
+                self.submit_thumb(idx)
+            else:
+                item.setIcon(icon)
             item.setText(str(idx + 1))
             self.thumb_list.addItem(item)
         self.thumb_list.setCurrentRow(self.current_index)
 
+    def submit_thumb(self, idx: int):
+        frame = self._frames_buf[idx].copy()
+        self._thumb_pool.start(
+            ThumbRenderer(self._thumb_signals, self._thumb_ids[idx], frame)
+        )
+
+    def on_thumb_rendered(self, thumb_id: int, img: QImage):
+        """GUI 线程：把后台生成的 QImage 转成图标"""
+        try:
+            idx = self._thumb_ids.index(thumb_id)  # 期间插入/删除帧会改变下标
+        except ValueError:
+            return  # 帧已删除、被编辑或重新载入/缩放，结果过期
+        if self._thumb_cache[idx] is not None:
+            return  # 期间已被同步生成
+        icon = QIcon(PixelIconEngine(QPixmap.fromImage(img)))
+        self._thumb_cache[idx] = icon
+        self.thumb_list.item(idx).setIcon(icon)
+
+    def insert_thumb(self, idx: int):
+        """只为新插入的第 idx 帧创建一个列表项，并给其后的项重新编号"""
+        item = QListWidgetItem()
+        item.setIcon(self.thumb_icon(idx))
+        self.thumb_list.insertItem(idx, item)
+        self.renumber_thumbs(idx)
+        self.thumb_list.setCurrentRow(self.current_index)
+
+    def remove_thumb(self, idx: int):
+        """移除第 idx 帧的列表项，并给其后的项重新编号"""
+        self.thumb_list.takeItem(idx)
+        self.renumber_thumbs(idx)
+        self.thumb_list.setCurrentRow(self.current_index)
+
+    def renumber_thumbs(self, start: int):
+        for idx in range(start, self.thumb_list.count()):
+            self.thumb_list.item(idx).setText(str(idx + 1))
+
     def refresh_thumb(self, idx: int):
         item = self.thumb_list.item(idx)
         if item:
-            item.setIcon(QIcon(self.frame_to_pixmap(self.frames[idx])))
+            item.setIcon(self.thumb_icon(idx))
 
     # ---------- Frame operations ----------
     def on_thumb_clicked(self, item: QListWidgetItem):
@@ -280,35 +509,42 @@ class PixelArtEditor(QMainWindow):
         self.update_status()
 
     def add_frame(self):
-        self.frames.insert(
-            self.current_index + 1, np.zeros((self.rows, self.cols), dtype=np.uint8)
-        )
+        self.insert_frame(self.current_index + 1, 0)
+        self._thumb_cache.insert(self.current_index + 1, None)
+        self._thumb_ids.insert(self.current_index + 1, next(self._thumb_id_counter))
         self.current_index += 1
-        self.refresh_thumbs()
+        self.insert_thumb(self.current_index)
         self.update_status()
         self.redraw_current_frame()
 
     def copy_frame(self):
         """复制当前帧并插入到下一个位置"""
-        current_frame_copy = self.current_frame().copy()
-        self.frames.insert(self.current_index + 1, current_frame_copy)
+        self.insert_frame(self.current_index + 1, self.current_frame())
+        # 图像相同，直接复用当前帧的缩略图
+        self._thumb_cache.insert(
+            self.current_index + 1, self._thumb_cache[self.current_index]
+        )
+        self._thumb_ids.insert(self.current_index + 1, next(self._thumb_id_counter))
         self.current_index += 1
-        self.refresh_thumbs()
+        self.insert_thumb(self.current_index)
         self.update_status()
         self.redraw_current_frame()
 
     def delete_frame(self):
-        if len(self.frames) == 1:
+        if self.n_frames == 1:
             QMessageBox.information(self, "Info", "Cannot delete the only frame.")
             return
-        self.frames.pop(self.current_index)
+        self.remove_frame(self.current_index)
+        self._thumb_cache.pop(self.current_index)
+        self._thumb_ids.pop(self.current_index)
+        removed = self.current_index
         self.current_index = max(0, self.current_index - 1)
-        self.refresh_thumbs()
+        self.remove_thumb(removed)
         self.update_status()
         self.redraw_current_frame()
 
     def next_frame(self):
-        self.current_index = (self.current_index + 1) % len(self.frames)
+        self.current_index = (self.current_index + 1) % self.n_frames
         self.thumb_list.setCurrentRow(self.current_index)
         self.redraw_current_frame()
         self.update_status()
@@ -340,28 +576,31 @@ class PixelArtEditor(QMainWindow):
         self.apply_resize(new_rows, new_cols)
 
     def apply_resize(self, new_rows: int, new_cols: int):
-        new_frames: list[np.ndarray] = []
-        for fr in self.frames:
-            h, w = fr.shape
-            nr = np.zeros((new_rows, new_cols), dtype=np.uint8)
-            min_r = min(h, new_rows)
-            min_c = min(w, new_cols)
-            nr[:min_r, :min_c] = fr[:min_r, :min_c]
-            new_frames.append(nr)
-        self.frames = new_frames
-        self.rows, self.cols = new_rows, new_cols
-        self.update_table_geometry()
-        self.refresh_thumbs()
-        self.update_status()
+        src = self.frames_arr
+        n, h, w = src.shape
+        min_r = min(h, new_rows)
+        min_c = min(w, new_cols)
+        dst = np.zeros((n, new_rows, new_cols), dtype=np.uint8)
+        if _resize_stack is not None and n >= NUMBA_MIN_FRAMES:
+            _resize_stack(src, dst, min_r, min_c)
+        else:
+            dst[:, :min_r, :min_c] = src[:, :min_r, :min_c]
+        self.set_frames(dst)
 
     # ---------- Export / Import ----------
     def export_all(self):
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Export animation", filter="NumPy Files (*.npy)"
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export animation", filter=f"{NPY_FILTER};;{PACKED_FILTER}"
         )
         if not path:
             return
-        np.save(path, np.stack(self.frames, axis=0))
+        if selected == PACKED_FILTER or Path(path).suffix.lower() == ".npz":
+            if Path(path).suffix.lower() != ".npz":
+                path += ".npz"
+            np.savez(path, bits=pack_frames(self.frames_arr), cols=self.cols)
+        else:
+            # frames_arr 是连续缓冲区的视图，np.save 直接写出，无需 np.stack 拷贝
+            np.save(path, self.frames_arr, allow_pickle=False)
         QMessageBox.information(self, "Saved", f"Saved to {path}")
 
     def export_frame(self):
@@ -370,25 +609,30 @@ class PixelArtEditor(QMainWindow):
         )
         if not path:
             return
-        np.save(path, self.current_frame())
+        np.save(path, self.current_frame(), allow_pickle=False)
         QMessageBox.information(self, "Saved", f"Saved to {path}")
 
     def load_frames(self):
         path, _ = QFileDialog.getOpenFileName(
-            self, "Load animation", filter="NumPy Files (*.npy)"
+            self, "Load animation", filter="Animation Files (*.npy *.npz)"
         )
         if not path:
             return
         try:
-            data = np.load(path)
+            if Path(path).suffix.lower() == ".npz":
+                with np.load(path, allow_pickle=False) as packed:
+                    data = unpack_frames(packed["bits"], int(packed["cols"]))
+            else:
+                # 内存映射读取，下面归一化时一次遍历直接生成帧数组
+                data = np.load(path, mmap_mode="r", allow_pickle=False)
             if data.ndim == 2:
                 data = data[np.newaxis, ...]  # single frame
             if data.ndim != 3:
                 raise ValueError("Expected 2‑D or 3‑D array")
-            new_rows, new_cols = data.shape[1:]  # (frames, rows, cols)
-            self.frames = [data[i].copy() for i in range(data.shape[0])]
             self.current_index = 0
-            self.apply_resize(new_rows, new_cols)
+            # 非零即黑，保证像素值只有 0/1（调色板只有两种颜色）；
+            # bool 与 uint8 同宽，view 不再额外拷贝
+            self.set_frames((data != 0).view(np.uint8))  # (frames, rows, cols)
             QMessageBox.information(self, "Loaded", f"Loaded {data.shape[0]} frame(s)")
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -396,7 +640,7 @@ class PixelArtEditor(QMainWindow):
     # ---------- Status ----------
     def update_status(self):
         self.status_lbl.setText(
-            f"Frame {self.current_index + 1}/{len(self.frames)}  |  Grid {self.rows}×{self.cols}"
+            f"Frame {self.current_index + 1}/{self.n_frames}  |  Grid {self.rows}×{self.cols}"
         )
 
 